@@ -3,78 +3,340 @@
 PDF Chapter Splitter with Manual Chapter Selection & Enhanced UI
 
 
-Requires:
-    pip install pypdf
+Requires (Python 3.8+):
+    pip install "pymupdf>=1.19"      (or: pip install pypdf, used as a fallback)
 Optional GUI:
     pip install customtkinter
 """
-import re
+import contextlib
+import functools
+import io
+import multiprocessing
+import os
+import stat
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
-from pypdf import PdfReader, PdfWriter
+import queue
 import sys
+import threading
+import zipfile
+
+try:
+    import pymupdf
+except ImportError:
+    try:
+        # PyMuPDF before 1.24.3 only ships the legacy 'fitz' module name
+        import fitz as pymupdf
+    except ImportError:
+        pymupdf = None
+        from pypdf import PdfReader, PdfWriter
 
 
 # ---------------- Core Logic ----------------
+WRITE_BUFFER_SIZE = 1 << 20
+BUNDLE_NAME = 'chapters.zip'
+# A pool worker costs ~0.15 s to start (it re-imports this module and reopens the
+# PDF). PyMuPDF copies hundreds of pages in that time, so only pypdf gets a pool,
+# with one worker per PAGES_PER_WORKER pages to copy.
+PAGES_PER_WORKER = 1000
+# Pages are copied unmodified, so PyMuPDF output skips every recompression,
+# garbage-collection and content-cleaning pass
+SAVE_OPTIONS = dict(garbage=0, clean=False, deflate=False,
+                    deflate_images=False, deflate_fonts=False)
+_UNSAFE_CHARS = str.maketrans({c: '_' for c in '\\/*?:"<>|'})
+
+
 def sanitize_filename(name: str) -> str:
     """Sanitize chapter title for filesystem."""
-    return re.sub(r'[\\/*?:"<>|]', '_', name).strip()
+    return name.translate(_UNSAFE_CHARS).strip()
+
+
+
+
+def open_pdf(input_pdf):
+    """Open a PDF with PyMuPDF when available, otherwise with pypdf."""
+    if pymupdf is not None:
+        return pymupdf.open(str(input_pdf))
+    return PdfReader(str(input_pdf), strict=False)
+
+
+
+
+def get_chapter_ranges(reader, max_level=1):
+    """Return a tuple of (title, start, end) from the bookmarks of an open PDF.
+
+    Bookmarks nested deeper than max_level are ignored (None keeps every level).
+    Each entry runs until the next bookmark at the same or a shallower level, so
+    a part spans all of its chapters and a chapter spans all of its sections.
+    """
+    if pymupdf is not None:
+        # get_toc() is already flattened in document order: [level, title, 1-based page],
+        # with page -1 when the destination can't be resolved
+        raw = [(level, title, page - 1) for level, title, page in reader.get_toc()
+               if title and page > 0 and (max_level is None or level <= max_level)]
+        total = reader.page_count
+    else:
+        raw = _pypdf_outline(reader, max_level)
+        total = len(reader.pages)
+
+
+    # Stable sort: a parent stays ahead of a child that starts on the same page
+    raw.sort(key=lambda x: x[2])
+    ends = [total - 1] * len(raw)
+    open_entries = []
+    for i, (level, _, start) in enumerate(raw):
+        # This bookmark closes every open one at its own level or deeper
+        while open_entries and raw[open_entries[-1]][0] >= level:
+            j = open_entries.pop()
+            # Siblings sharing a page both keep it rather than getting an empty range
+            ends[j] = max(start - 1, raw[j][2])
+        open_entries.append(i)
+    return tuple((title, start, end) for (_, title, start), end in zip(raw, ends))
+
+
+
+
+@functools.lru_cache(maxsize=1)
+def _document_for(path: str, mtime_ns: int, size: int):
+    """Keep the last opened PDF so range parsing and writing share one parse."""
+    return open_pdf(path)
+
 
 
 
+@functools.lru_cache(maxsize=8)
+def _ranges_for(path: str, mtime_ns: int, size: int, max_level):
+    """Cached chapter ranges; mtime and size are in the key so edits invalidate it."""
+    return get_chapter_ranges(_document_for(path, mtime_ns, size), max_level)
 
-def get_chapter_ranges(input_pdf: Path):
-    """Return list of (title, start, end) from PDF bookmarks."""
-    reader = PdfReader(str(input_pdf))
+
+
+
+def stat_pdf(input_pdf):
+    """Return os.stat() of input_pdf if it is a regular .pdf file, else None."""
+    path = os.fspath(input_pdf)
+    if not path.lower().endswith('.pdf'):
+        return None
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st if stat.S_ISREG(st.st_mode) else None
+
+
+
+
+def load_document(input_pdf, st=None):
+    """Return the open PDF for a path, reusing it while the file is unchanged."""
+    path = os.fspath(input_pdf)
+    if st is None:
+        st = os.stat(path)
+    return _document_for(path, st.st_mtime_ns, st.st_size)
+
+
+
+
+def load_chapter_ranges(input_pdf, st=None, max_level=1):
+    """Return chapter ranges for a PDF path, reusing them while the file is unchanged.
+
+    Pass st (from stat_pdf) to avoid statting the file a second time.
+    """
+    path = os.fspath(input_pdf)
+    if st is None:
+        st = os.stat(path)
+    return _ranges_for(path, st.st_mtime_ns, st.st_size, max_level)
+
+
+
+
+def _pypdf_outline(reader, max_level=1):
+    """Return (level, title, page) for the bookmarks of a PdfReader, top level being 1.
+
+    Bookmarks nested deeper than max_level are skipped (None keeps every level).
+    """
     outlines = getattr(reader, 'outlines', None) or getattr(reader, 'outline', None)
     if outlines is None:
         outlines = reader.get_outlines()
 
 
+    # Map page object numbers to indices once instead of resolving each bookmark
+    page_by_idnum = {}
+    for i, pg in enumerate(reader.pages):
+        ref = getattr(pg, 'indirect_reference', None)
+        if ref is not None:
+            page_by_idnum[ref.idnum] = i
+
+
+    # pypdf nests children as a list right after their parent; most books are flat
+    # (or only the top level is wanted), so only walk nested lists when needed,
+    # with an explicit stack whose depth is the bookmark level
+    if max_level != 1 and any(isinstance(x, list) for x in outlines):
+        items = []
+        stack = [iter(outlines)]
+        while stack:
+            for item in stack[-1]:
+                if isinstance(item, list):
+                    if max_level is None or len(stack) < max_level:
+                        stack.append(iter(item))
+                        break
+                    continue
+                items.append((len(stack), item))
+            else:
+                stack.pop()
+    else:
+        items = [(1, item) for item in outlines if not isinstance(item, list)]
+
+
     raw = []
-    for item in outlines:
+    lookup = page_by_idnum.get
+    for level, item in items:
         title = getattr(item, 'title', None)
         if not title:
             continue
-        try:
-            page = reader.get_destination_page_number(item)
-        except Exception:
-            continue
-        raw.append((title, page))
+        page = lookup(getattr(item.page, 'idnum', None))
+        if page is None:
+            try:
+                page = reader.get_destination_page_number(item)
+            except Exception:
+                continue
+            # Link-only bookmarks have no destination page; PyMuPDF drops them too
+            if page is None:
+                continue
+        raw.append((level, title, page))
+    return raw
+
+
+
+
+def _write_chapter(reader, title, start, end, num, output_dir, bundle=False):
+    """Write pages start..end of an open PDF as chapter number num.
+
+    Returns (fname, data). With bundle=True nothing is written to disk and data
+    holds the chapter's PDF bytes for the caller to store; otherwise data is None.
+    """
+    fname = f"{num:02d}_{sanitize_filename(title)}.pdf"
+    if pymupdf is not None:
+        # insert_pdf copies the page objects in C, far faster than pypdf's add_page
+        out = pymupdf.open()
+        out.insert_pdf(reader, from_page=start, to_page=end)
+        if bundle:
+            data = out.tobytes(**SAVE_OPTIONS)
+        else:
+            data = None
+            out.save(str(Path(output_dir) / fname), **SAVE_OPTIONS)
+        out.close()
+    else:
+        # A fresh writer per chapter is cheap and pypdf has no way to reset one.
+        # append_pages_from_reader() is no shortcut: it copies every page of the
+        # reader (its callback runs after each append, it does not filter).
+        writer = PdfWriter()
+        pages, add = reader.pages, writer.add_page
+        for p in range(start, end+1): add(pages[p])
+        if bundle:
+            buf = io.BytesIO()
+            writer.write(buf)
+            data = buf.getvalue()
+        else:
+            data = None
+            # PdfWriter.write issues many small writes; a 1 MiB buffer batches them
+            with open(Path(output_dir) / fname, 'wb', buffering=WRITE_BUFFER_SIZE) as f:
+                writer.write(f)
+    return fname, data
+
+
+
 
+_worker_reader = None
 
-    raw.sort(key=lambda x: x[1])
-    total = len(reader.pages)
-    ranges = []
-    for i, (title, start) in enumerate(raw):
-        end = raw[i+1][1] - 1 if i+1 < len(raw) else total - 1
-        ranges.append((title, start, end))
-    return ranges
 
+def _write_one(input_pdf, title, start, end, num, output_dir, bundle):
+    """Process-pool worker: write one chapter, opening the PDF once per process.
 
+    The PDF is opened here rather than in a pool initializer so that a failure
+    (file moved or locked) surfaces through the future instead of breaking the pool.
+    """
+    global _worker_reader
+    if _worker_reader is None:
+        _worker_reader = open_pdf(input_pdf)
+    return _write_chapter(_worker_reader, title, start, end, num, output_dir, bundle)
 
 
-def write_chapters(ranges, reader, output_dir: Path, selected_idx=None):
-    """Write specified chapters to PDF files."""
+
+
+def write_chapters(ranges, input_pdf, output_dir: Path, selected_idx=None, progress=None,
+                   bundle=False, reader=None):
+    """Write specified chapters to PDF files.
+
+    Chapters are independent, so large pypdf jobs are spread across a process
+    pool; everything else runs in-process. progress, if given, is called as
+    progress(done, total) after each chapter.
+    With bundle=True the chapters are stored in a single BUNDLE_NAME zip in
+    output_dir instead of as separate files. The in-process path uses reader if
+    given, else the document load_document() already parsed for the ranges.
+    """
     if selected_idx is None:
-        selected = list(range(len(ranges)))
+        selected_idx = range(len(ranges))
+    # Ordering and numbering in one pass: files are numbered by position in selected_idx
+    jobs = [(*ranges[idx], num) for num, idx in enumerate(selected_idx, start=1)]
+    total = len(jobs)
+    if not total:
+        return 0
+    if pymupdf is not None:
+        workers = 1
     else:
-        selected = selected_idx
+        pages = sum(end - start + 1 for _, start, end, _ in jobs)
+        workers = min(os.cpu_count() or 1, total, pages // PAGES_PER_WORKER)
+    out_dir = os.fspath(output_dir)
     count = 0
-    for num, idx in enumerate(selected, start=1):
-        title, start, end = ranges[idx]
-        writer = PdfWriter()
-        for p in range(start, end+1): writer.add_page(reader.pages[p])
-        fname = f"{num:02d}_{sanitize_filename(title)}.pdf"
-        with open(output_dir / fname, 'wb') as f:
-            writer.write(f)
-        count += 1
+    # The bundle is built under a temporary name and only replaces BUNDLE_NAME once
+    # every chapter is stored, so a failure never leaves (or clobbers with) a
+    # truncated archive
+    bundle_path = Path(out_dir) / BUNDLE_NAME
+    bundle_tmp = bundle_path.with_name(BUNDLE_NAME + '.part')
+    try:
+        with contextlib.ExitStack() as stack:
+            bundle_zip = None
+            if bundle:
+                # PDF streams are already compressed, so store rather than deflate
+                bundle_zip = stack.enter_context(zipfile.ZipFile(
+                    bundle_tmp, 'w', zipfile.ZIP_STORED, allowZip64=True))
+            if workers <= 1:
+                if reader is None:
+                    reader = load_document(input_pdf)
+                results = (_write_chapter(reader, *job, out_dir, bundle) for job in jobs)
+            else:
+                # Readers aren't picklable: each worker opens the PDF once in _write_one
+                # and only strings and ints cross the process boundary per chapter.
+                # The pool is started from the GUI's split thread, and forking a
+                # multi-threaded process can deadlock, so never use 'fork'.
+                start_method = ('forkserver' if 'forkserver' in multiprocessing.get_all_start_methods()
+                                else 'spawn')
+                pool = stack.enter_context(ProcessPoolExecutor(
+                    max_workers=workers,
+                    mp_context=multiprocessing.get_context(start_method)))
+                src = os.fspath(input_pdf)
+                futures = [pool.submit(_write_one, src, *job, out_dir, bundle) for job in jobs]
+                results = (fut.result() for fut in as_completed(futures))
+            for fname, data in results:
+                if bundle_zip is not None:
+                    bundle_zip.writestr(fname, data)
+                count += 1
+                if progress:
+                    progress(count, total)
+    except BaseException:
+        if bundle:
+            with contextlib.suppress(OSError):
+                os.remove(bundle_tmp)
+        raise
+    if bundle:
+        os.replace(bundle_tmp, bundle_path)
     return count
 
 
 # -------- GUI SELECTION --------
 try:
     import customtkinter as ctk
-    from tkinter import filedialog, messagebox
+    from tkinter import filedialog, messagebox, ttk
     GUI_LIB = 'custom'
 except ImportError:
     import tkinter as tk
@@ -82,15 +344,152 @@ except ImportError:
     GUI_LIB = 'ttk'
 
 
+BOOKMARK_DEPTHS = ['1', '2', '3', 'All']
+
+
+def parse_depth(value):
+    """Map a Bookmark Depth choice to get_chapter_ranges' max_level."""
+    return None if value == 'All' else int(value)
+
+
+class ChapterList(ttk.Frame):
+    """Scrollable chapter checklist backed by a single ttk.Treeview.
+
+    Rows are Treeview items with a checkbox glyph instead of one check widget
+    per chapter, so books with hundreds of bookmarks open without stalling.
+    Click a row, or move to it with the arrow keys and press Space/Enter, to toggle it.
+    """
+    CHECKED, UNCHECKED = '\u2611', '\u2610'
+
+    def __init__(self, master, ranges, order):
+        super().__init__(master)
+        # Rows follow order (indices into ranges) and are numbered by position in it
+        self.order = order
+        self.labels = {idx: f'{pos:02d} - {ranges[idx][0]}'
+                       for pos, idx in enumerate(order, start=1)}
+        self.selected = set(order)
+        # 'browse' highlights the focused row, which is the keyboard cursor
+        self.tree = ttk.Treeview(self, show='tree', selectmode='browse')
+        sb = ttk.Scrollbar(self, orient='vertical', command=self.tree.yview)
+        self.tree.configure(yscrollcommand=sb.set)
+        self.tree.pack(side='left', fill='both', expand=True)
+        sb.pack(side='right', fill='y')
+        for idx in order:
+            self.tree.insert('', 'end', iid=str(idx), text=f'{self.CHECKED} {self.labels[idx]}')
+        if order:
+            first = str(order[0])
+            self.tree.focus(first)
+            self.tree.selection_set(first)
+        self.tree.bind('<Button-1>', self._on_click)
+        self.tree.bind('<space>', self._on_key)
+        self.tree.bind('<Return>', self._on_key)
+
+    def _on_click(self, event):
+        iid = self.tree.identify_row(event.y)
+        if not iid:
+            # Let Treeview handle clicks that miss every row
+            return None
+        self.tree.focus_set()
+        self.tree.focus(iid)
+        self.tree.selection_set(iid)
+        self._toggle(int(iid))
+        return 'break'
+
+    def _on_key(self, event):
+        iid = self.tree.focus()
+        if iid:
+            self._toggle(int(iid))
+        return 'break'
+
+    def _toggle(self, i):
+        if i in self.selected:
+            self.selected.discard(i)
+        else:
+            self.selected.add(i)
+        self._refresh(i)
+
+    def _refresh(self, i):
+        glyph = self.CHECKED if i in self.selected else self.UNCHECKED
+        self.tree.item(str(i), text=f'{glyph} {self.labels[i]}')
+
+    def set_all(self, checked):
+        """Check or uncheck every chapter."""
+        self.selected = set(self.order) if checked else set()
+        for i in self.order:
+            self._refresh(i)
+
+    def selected_indices(self):
+        """Return the checked chapter indices in list order."""
+        return [i for i in self.order if i in self.selected]
+
+
+class SplitRunnerMixin:
+    """Runs write_chapters on a worker thread for either GUI.
+
+    The host window provides split_btn, show_progress(done, total) and Tk's after().
+    """
+    # Only touched on the Tk thread: set by start_split, cleared once the
+    # result has been shown, so one split and one poll loop run at a time
+    splitting = False
+
+    def start_split(self, ranges, inp, out_dir, selected_idx=None, bundle=False):
+        """Write chapters on a worker thread so the window stays responsive.
+
+        Returns False without starting anything while another split is running.
+        """
+        if self.splitting:
+            messagebox.showwarning('Busy', 'A split is already running')
+            return False
+        self.splitting = True
+        self.split_btn.configure(state='disabled')
+        self.show_progress(0, 1)
+        self.split_queue = queue.Queue()
+        threading.Thread(target=self._do_split,
+                         args=(ranges, inp, out_dir, selected_idx, bundle),
+                         daemon=True).start()
+        self.after(50, self._poll_progress)
+        return True
+
+    def _do_split(self, ranges, inp, out_dir, selected_idx, bundle):
+        # Runs off the Tk thread: only talk to the GUI through the queue
+        q = self.split_queue
+        try:
+            count = write_chapters(ranges, inp, out_dir, selected_idx=selected_idx,
+                                   progress=lambda done, total: q.put(('progress', done, total)),
+                                   bundle=bundle)
+            where = f' in {BUNDLE_NAME}' if bundle else ''
+            q.put(('done', f'Created {count} PDFs{where}'))
+        except Exception as e:
+            q.put(('error', str(e)))
+
+    def _poll_progress(self):
+        while True:
+            try:
+                msg = self.split_queue.get_nowait()
+            except queue.Empty:
+                break
+            if msg[0] == 'progress':
+                self.show_progress(msg[1], msg[2])
+                continue
+            self.splitting = False
+            self.split_btn.configure(state='normal')
+            if msg[0] == 'done':
+                messagebox.showinfo('Done', msg[1])
+            else:
+                messagebox.showerror('Error', msg[1])
+            return
+        self.after(50, self._poll_progress)
+
+
 # ------------------ CUSTOMTKINTER MODE ------------------
 if GUI_LIB == 'custom':
-    class PDFSplitterApp(ctk.CTk):
+    class PDFSplitterApp(SplitRunnerMixin, ctk.CTk):
         def __init__(self):
             super().__init__()
             ctk.set_appearance_mode('System')
             ctk.set_default_color_theme('dark-blue')
             self.title('PDF Chapter Splitter')
-            self.geometry('700x350')
+            self.geometry('700x440')
             self.grid_columnconfigure(1, weight=1)
 
 
@@ -98,7 +497,9 @@ if GUI_LIB == 'custom':
             self.input_var = ctk.StringVar()
             self.output_var = ctk.StringVar()
             self.order_var = ctk.StringVar(value='Ascending')
+            self.depth_var = ctk.StringVar(value='1')
             self.manual_var = ctk.BooleanVar(value=False)
+            self.bundle_var = ctk.BooleanVar(value=False)
 
 
             # Input PDF row
@@ -119,15 +520,34 @@ if GUI_LIB == 'custom':
                              values=['Ascending', 'Descending'], state='readonly').grid(row=2, column=1, sticky='w', padx=5)
 
 
+            # Bookmark depth: 1 = top-level chapters only
+            ctk.CTkLabel(self, text='Bookmark Depth:').grid(row=3, column=0, sticky='e', padx=10, pady=5)
+            ctk.CTkComboBox(self, variable=self.depth_var,
+                             values=BOOKMARK_DEPTHS, state='readonly').grid(row=3, column=1, sticky='w', padx=5)
+
+
             # Manual selection toggle
             ctk.CTkCheckBox(self, text='Manual Chapter Selection',
-                            variable=self.manual_var).grid(row=3, column=1,
+                            variable=self.manual_var).grid(row=4, column=1,
+                            sticky='w', padx=5, pady=5)
+
+
+            # Bundle toggle: one zip instead of many small files
+            ctk.CTkCheckBox(self, text=f'Bundle into {BUNDLE_NAME}',
+                            variable=self.bundle_var).grid(row=5, column=1,
                             sticky='w', padx=5, pady=5)
 
 
             # Split button
-            ctk.CTkButton(self, text='Split Chapters', fg_color='#10A37F',
-                          hover_color='#0c7f5a', command=self.on_split).grid(row=4, column=1, pady=15)
+            self.split_btn = ctk.CTkButton(self, text='Split Chapters', fg_color='#10A37F',
+                                           hover_color='#0c7f5a', command=self.on_split)
+            self.split_btn.grid(row=6, column=1, pady=15)
+
+
+            # Progress bar
+            self.progress = ctk.CTkProgressBar(self)
+            self.progress.grid(row=7, column=1, sticky='we', padx=5)
+            self.progress.set(0)
 
 
         def browse_inp(self):
@@ -143,29 +563,35 @@ if GUI_LIB == 'custom':
 
 
         def on_split(self):
-            inp = Path(self.input_var.get())
+            inp = self.input_var.get()
             out = Path(self.output_var.get())
-            if not inp.exists() or inp.suffix.lower() != '.pdf':
+            st = stat_pdf(inp)
+            if st is None:
                 messagebox.showerror('Error','Invalid PDF')
                 return
             out.mkdir(parents=True, exist_ok=True)
 
 
-            # Get chapter ranges and optionally reverse
-            ranges = get_chapter_ranges(inp)
-            reader = PdfReader(str(inp))
+            # Get chapter ranges; the order is a range of indices, numbered on write
+            ranges = load_chapter_ranges(inp, st, parse_depth(self.depth_var.get()))
             if self.order_var.get() == 'Descending':
-                ranges.reverse()
+                order = range(len(ranges) - 1, -1, -1)
+            else:
+                order = range(len(ranges))
 
 
             if self.manual_var.get():
-                self.show_manual_dialog(ranges, reader, out)
+                self.show_manual_dialog(ranges, order, inp, out)
             else:
-                count = write_chapters(ranges, reader, out)
-                messagebox.showinfo('Done', f'Created {count} PDFs')
+                self.start_split(ranges, inp, out, selected_idx=order,
+                                 bundle=self.bundle_var.get())
+
 
+        def show_progress(self, done, total):
+            self.progress.set(done / total)
 
-        def show_manual_dialog(self, ranges, reader, out_dir):
+
+        def show_manual_dialog(self, ranges, order, inp, out_dir):
             win = ctk.CTkToplevel(self)
             win.title('Select Chapters')
             win.geometry('400x500')
@@ -177,29 +603,23 @@ if GUI_LIB == 'custom':
 
             # Toggle button: alternates select/deselect all
             def toggle():
-                for var in checks:
-                    var.set(toggle_flag['all'])
+                chapters.set_all(not toggle_flag['all'])
                 toggle_flag['all'] = not toggle_flag['all']
 
 
             ctk.CTkButton(win, text='Toggle All', command=toggle).pack(pady=5)
 
 
-            # Scrollable checkbox frame
-            frame = ctk.CTkScrollableFrame(win)
-            frame.pack(expand=True, fill='both', pady=5)
-            checks = []
-            for i, (title, _, _) in enumerate(ranges):
-                var = ctk.BooleanVar(value=True)
-                ctk.CTkCheckBox(frame, text=f'{i+1:02d} - {title}', variable=var)
-                checks.append(var)
+            # Scrollable chapter list
+            chapters = ChapterList(win, ranges, order)
+            chapters.pack(expand=True, fill='both', pady=5)
 
 
             def confirm():
-                selected = [i for i, var in enumerate(checks) if var.get()]
-                count = write_chapters(ranges, reader, out_dir, selected_idx=selected)
-                messagebox.showinfo('Done', f'Created {count} PDFs')
-                win.destroy()
+                selected = chapters.selected_indices()
+                if self.start_split(ranges, inp, out_dir, selected_idx=selected,
+                                    bundle=self.bundle_var.get()):
+                    win.destroy()
 
 
             ctk.CTkButton(win, text='Confirm', fg_color='#10A37F',
@@ -212,11 +632,11 @@ if GUI_LIB == 'custom':
 
 # ------------------ TKINTER/TTK MODE ------------------
 else:
-    class PDFSplitterApp(ttk.Frame):
+    class PDFSplitterApp(SplitRunnerMixin, ttk.Frame):
         def __init__(self, master):
             super().__init__(master, padding=20)
             master.title('PDF Chapter Splitter')
-            master.geometry('700x350')
+            master.geometry('700x440')
             master.grid_columnconfigure(0, weight=1)
             master.grid_rowconfigure(0, weight=1)
             self.grid(row=0, column=0, sticky='nsew')
@@ -226,7 +646,9 @@ else:
             self.inp = tk.StringVar()
             self.outd = tk.StringVar()
             self.order = tk.StringVar(value='Ascending')
+            self.depth = tk.StringVar(value='1')
             self.manual = tk.BooleanVar(value=False)
+            self.bundle = tk.BooleanVar(value=False)
 
 
             # Input PDF
@@ -248,14 +670,33 @@ else:
                          sticky='w', padx=5, pady=5)
 
 
+            # Bookmark depth
+            ttk.Label(self, text='Bookmark Depth:').grid(row=3, column=0, sticky='e')
+            ttk.Combobox(self, textvariable=self.depth,
+                         values=BOOKMARK_DEPTHS, state='readonly').grid(row=3, column=1,
+                         sticky='w', padx=5, pady=5)
+
+
             # Manual toggle
             ttk.Checkbutton(self, text='Manual Chapter Selection', variable=self.manual).grid(
-                row=3, column=1, sticky='w', padx=5, pady=5
+                row=4, column=1, sticky='w', padx=5, pady=5
+            )
+
+
+            # Bundle toggle
+            ttk.Checkbutton(self, text=f'Bundle into {BUNDLE_NAME}', variable=self.bundle).grid(
+                row=5, column=1, sticky='w', padx=5, pady=5
             )
 
 
             # Split button
-            ttk.Button(self, text='Split Chapters', command=self.on_split).grid(row=4, column=1, pady=15)
+            self.split_btn = ttk.Button(self, text='Split Chapters', command=self.on_split)
+            self.split_btn.grid(row=6, column=1, pady=15)
+
+
+            # Progress bar
+            self.progress = ttk.Progressbar(self, mode='determinate')
+            self.progress.grid(row=7, column=1, sticky='we', padx=5)
 
 
         def browse_inp(self):
@@ -271,26 +712,32 @@ else:
 
 
         def on_split(self):
-            inp_path = Path(self.inp.get())
+            inp_path = self.inp.get()
             out_dir = Path(self.outd.get())
-            if not inp_path.exists() or inp_path.suffix.lower() != '.pdf':
+            st = stat_pdf(inp_path)
+            if st is None:
                 messagebox.showerror('Error', 'Invalid PDF')
                 return
             out_dir.mkdir(parents=True, exist_ok=True)
-            ranges = get_chapter_ranges(inp_path)
-            reader = PdfReader(str(inp_path))
+            ranges = load_chapter_ranges(inp_path, st, parse_depth(self.depth.get()))
             if self.order.get() == 'Descending':
-                ranges = list(reversed(ranges))
+                order = range(len(ranges) - 1, -1, -1)
+            else:
+                order = range(len(ranges))
 
 
             if self.manual.get():
-                self.popup_manual(ranges, reader, out_dir)
+                self.popup_manual(ranges, order, inp_path, out_dir)
             else:
-                count = write_chapters(ranges, reader, out_dir)
-                messagebox.showinfo('Done', f'Created {count} PDFs')
+                self.start_split(ranges, inp_path, out_dir, selected_idx=order,
+                                 bundle=self.bundle.get())
+
 
+        def show_progress(self, done, total):
+            self.progress.configure(maximum=total, value=done)
 
-        def popup_manual(self, ranges, reader, out_dir):
+
+        def popup_manual(self, ranges, order, inp_path, out_dir):
             win = tk.Toplevel(self)
             win.title('Select Chapters')
             win.geometry('400x500')
@@ -298,53 +745,27 @@ else:
 
             # Toggle state
             toggle_flag = {'all': True}
-            vars = []
 
 
             # Single toggle button
             def toggle():
-                for v in vars:
-                    v.set(toggle_flag['all'])
+                chapters.set_all(not toggle_flag['all'])
                 toggle_flag['all'] = not toggle_flag['all']
 
 
             ttk.Button(win, text='Toggle All', command=toggle).pack(pady=5)
 
 
-            # Scrollable list
-            frame = ttk.Frame(win)
-            frame.pack(fill='both', expand=True)
-            canvas = tk.Canvas(frame)
-            sb = ttk.Scrollbar(frame, orient='vertical', command=canvas.yview)
-            scroll_frame = ttk.Frame(canvas)
-            scroll_frame.bind(
-                '<Configure>', lambda e: canvas.configure(scrollregion=canvas.bbox('all'))
-            )
-            canvas.create_window((0,0), window=scroll_frame, anchor='nw')
-            canvas.configure(yscrollcommand=sb.set)
-
-
-            # Mousewheel scrolling
-            def _on_mousewheel(event):
-                canvas.yview_scroll(int(-1*(event.delta/120)), 'units')
-            canvas.bind_all('<MouseWheel>', _on_mousewheel)
-
-
-            canvas.pack(side='left', fill='both', expand=True)
-            sb.pack(side='right', fill='y')
-
-
-            for i, (title, _, _) in enumerate(ranges):
-                v = tk.BooleanVar(value=True)
-                ttk.Checkbutton(scroll_frame, text=f'{i+1:02d} - {title}', variable=v).pack(anchor='w')
-                vars.append(v)
+            # Scrollable list; the Treeview handles its own mousewheel scrolling
+            chapters = ChapterList(win, ranges, order)
+            chapters.pack(fill='both', expand=True)
 
 
             def confirm():
-                sel = [i for i, v in enumerate(vars) if v.get()]
-                count = write_chapters(ranges, reader, out_dir, selected_idx=sel)
-                messagebox.showinfo('Done', f'Created {count} PDFs')
-                win.destroy()
+                sel = chapters.selected_indices()
+                if self.start_split(ranges, inp_path, out_dir, selected_idx=sel,
+                                    bundle=self.bundle.get()):
+                    win.destroy()
 
 
             ttk.Button(win, text='Confirm', command=confirm).pack(pady=10)